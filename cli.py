@@ -1,17 +1,58 @@
 import os
+import re
 import sys
-import shutil
-import argparse
-import asyncio
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
+
+# shutil, argparse and asyncio are imported where used to keep startup fast
 
 # Update version references
 VERSION = "0.4.1"
 
+# Shorthand and alternate command names mapped to the command they run
+COMMAND_ALIASES = {
+    'we': 'work_effort',               # Non-interactive work effort
+    'work': 'work_effort',
+    'create': 'work_effort',
+    'l': 'list',                       # List work efforts
+    's': 'setup',                      # Setup command
+}
+
+def prompt_user(message):
+    """Prompt for a line of input without going through input()/readline"""
+    sys.stdout.write(message)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        # readline() returns '' at end of input where input() raised
+        raise EOFError
+    return line.rstrip("\n")
+
+def prompt_optional(message):
+    """Prompt for an optional value, returning None for a blank answer"""
+    answer = prompt_user(message)
+    return answer if answer.strip() else None
+
 # Re-import the necessary AI setup modules
 try:
     from utils.directory_scanner import select_directories, is_ai_setup_installed, create_ai_setup, install_ai_setup
-    from utils.thought_process import generate_content_with_ollama, get_available_ollama_models
+
+    # utils.thought_process pulls in asyncio, so it is imported on first use
+    # rather than on every start (fast paths such as --version never need it)
+    async def generate_content_with_ollama(*args, **kwargs):
+        try:
+            from utils.thought_process import generate_content_with_ollama as generate
+        except ImportError:
+            print("⚠️ Content generation not available: utils.thought_process module not found")
+            return None
+        return await generate(*args, **kwargs)
+
+    def get_available_ollama_models():
+        try:
+            from utils.thought_process import get_available_ollama_models as get_models
+        except ImportError:
+            return ["phi3", "llama3", "mistral"]  # Default fallbacks
+        return get_models()
 except ImportError:
     print("Warning: Required modules not found. Some functionality will be limited.")
 
@@ -23,7 +64,8 @@ except ImportError:
 
         print(f"\nScanning for directories in: {base_dir}")
         # Get directories and ensure they are unique
-        all_dirs = [d for d in os.listdir(base_dir) if os.path.isdir(os.path.join(base_dir, d)) and not d.startswith('.')]
+        with os.scandir(base_dir) as entries:
+            all_dirs = [e.name for e in entries if e.is_dir() and not e.name.startswith('.')]
         dirs = sorted(set(all_dirs))
 
         if len(dirs) != len(all_dirs):
@@ -37,7 +79,7 @@ except ImportError:
         for i, d in enumerate(dirs):
             print(f"{i+1}. {d}")
 
-        selections = input("\nEnter directory numbers separated by space (e.g., '1 3 4') or 'all': ")
+        selections = prompt_user("\nEnter directory numbers separated by space (e.g., '1 3 4') or 'all': ")
 
         if selections.lower() == 'all':
             return [os.path.join(base_dir, d) for d in dirs]
@@ -61,8 +103,7 @@ except ImportError:
         setup_folder = os.path.join(root_dir, ".AI_setup")
 
         # Create .AI_setup folder
-        if not os.path.exists(setup_folder):
-            os.makedirs(setup_folder)
+        os.makedirs(setup_folder, exist_ok=True)
 
         # Create all other files first
         # 1. Create INSTRUCTIONS.md
@@ -368,37 +409,55 @@ Planned future features include:
         print(f"✅ Created AI_setup in: {root_dir}")
         return setup_folder
 
-    def install_ai_setup(target_dirs):
-        """Install AI_setup in target directories."""
-        # Create a temporary .AI_setup in the current directory
-        temp_dir = os.getcwd()
-        setup_folder = create_ai_setup(temp_dir)
+    def install_ai_setup_in_dir(directory, setup_folder):
+        """Copy a generated .AI_setup folder into one directory, returning its status messages."""
+        import shutil
 
-        # Copy to selected directories
-        for directory in target_dirs:
-            # Skip if directory doesn't exist
-            if not os.path.exists(directory) or not os.path.isdir(directory):
-                print(f"❌ Directory not found: {directory}")
-                continue
+        # Skip if directory doesn't exist
+        if not os.path.isdir(directory):
+            return [f"❌ Directory not found: {directory}"]
 
-            # Skip if already installed
-            if is_ai_setup_installed(directory):
-                print(f"⚠️ AI_setup already installed in: {directory}")
-                continue
+        # Skip if already installed
+        if is_ai_setup_installed(directory):
+            return [f"⚠️ AI_setup already installed in: {directory}"]
 
+        try:
             # Create .AI_setup in target directory
             target_setup = os.path.join(directory, ".AI_setup")
-            if not os.path.exists(target_setup):
-                os.makedirs(target_setup)
+            os.makedirs(target_setup, exist_ok=True)
 
             # Copy all files from temporary .AI_setup to target
-            for item in os.listdir(setup_folder):
-                source = os.path.join(setup_folder, item)
-                target = os.path.join(target_setup, item)
-                if os.path.isfile(source):
-                    shutil.copy2(source, target)
+            with os.scandir(setup_folder) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        # The sources were just generated, so there is no metadata
+                        # worth preserving; copyfile skips copy2's copystat calls
+                        shutil.copyfile(entry.path, os.path.join(target_setup, entry.name))
+        except OSError as e:
+            # Report the failure so the other targets' results are still printed
+            return [f"❌ Failed to install AI_setup in {directory}: {e}"]
+
+        return [f"✅ Installed AI_setup in: {directory}"]
 
-            print(f"✅ Installed AI_setup in: {directory}")
+    def install_ai_setup(target_dirs):
+        """Install AI_setup in target directories."""
+        import shutil
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Create a temporary .AI_setup in the current directory
+        temp_dir = os.getcwd()
+        setup_folder = create_ai_setup(temp_dir)
+
+        # Copy to selected directories in a few threads; messages are printed
+        # afterwards in the original order
+        if target_dirs:
+            with ThreadPoolExecutor(max_workers=min(8, len(target_dirs))) as executor:
+                results = list(executor.map(
+                    lambda directory: install_ai_setup_in_dir(directory, setup_folder),
+                    target_dirs))
+            for messages in results:
+                for message in messages:
+                    print(message)
 
         # Clean up temporary .AI_setup if it was created for this operation
         if os.path.dirname(setup_folder) == temp_dir:
@@ -413,6 +472,75 @@ Planned future features include:
         return ["phi3", "llama3", "mistral"]  # Default fallbacks
 
 
+@lru_cache(maxsize=None)
+def find_package_scripts_dir():
+    """Locate the bundled work_efforts scripts, or None if there are none
+
+    The answer cannot change while the process runs, so it is probed once.
+    """
+    # Try to find the scripts in the installed package
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    package_scripts_dir = os.path.join(package_dir, "work_efforts", "scripts")
+    if os.path.isdir(package_scripts_dir):
+        return package_scripts_dir
+
+    # If not found, try looking in the development directory structure
+    package_scripts_dir = os.path.join(os.path.dirname(package_dir), "work_efforts", "scripts")
+    if os.path.isdir(package_scripts_dir):
+        return package_scripts_dir
+
+    return None
+
+# README written into every new work_efforts directory
+WORK_EFFORTS_README = """# Work Efforts - Johnny Decimal System
+
+This directory contains structured documentation for tracking tasks, features, and bug fixes using the Johnny Decimal methodology.
+
+## Johnny Decimal Structure
+
+### Major Categories
+- **00_system** - System and infrastructure work
+- **10_development** - Feature development and code improvements
+- **20_debugging** - Debugging and troubleshooting
+- **30_documentation** - Documentation and guides
+- **40_testing** - Testing and validation
+- **50_maintenance** - Maintenance and updates
+
+### Navigation
+Start with the main index: `00.00_work_efforts_index.md`
+
+Each category has its own index file (e.g., `00_system/00.00_index.md`)
+
+## Status Management
+Work effort status is managed within each document's frontmatter:
+- **status: "active"** - Currently being worked on
+- **status: "paused"** - Temporarily on hold
+- **status: "completed"** - Finished successfully
+- **status: "cancelled"** - Abandoned or no longer needed
+
+## Essential Directories
+- **templates/** - Templates for work effort documents
+- **archived/** - Deprecated or abandoned work efforts (for permanent archive)
+- **scripts/** - Helper scripts for managing work efforts
+
+## Usage
+
+Create a new work effort:
+```
+cc-ai work_effort --title "Feature Name" --priority high
+```
+
+Or use the interactive mode:
+```
+cc-ai work_effort -i
+```
+
+List all work efforts:
+```
+cc-ai list
+```
+"""
+
 def setup_work_efforts_structure(base_dir=None, create_dirs=True, in_ai_setup=False):
     """
     Set up the work_efforts directory structure in the specified directory
@@ -441,131 +569,106 @@ def setup_work_efforts_structure(base_dir=None, create_dirs=True, in_ai_setup=Fa
         # Create at the root level (original behavior)
         work_efforts_dir = os.path.join(base_dir, "work_efforts")
 
+    # work_efforts_dir is always a joined path with no trailing separator,
+    # so the prefix is built once and the subdirectories appended to it
+    prefix = f"{work_efforts_dir}{os.sep}"
+
     # Johnny Decimal structure directories
     johnny_decimal_dirs = {
-        "00_system": os.path.join(work_efforts_dir, "00_system"),
-        "10_development": os.path.join(work_efforts_dir, "10_development"),
-        "20_debugging": os.path.join(work_efforts_dir, "20_debugging"),
-        "30_documentation": os.path.join(work_efforts_dir, "30_documentation"),
-        "40_testing": os.path.join(work_efforts_dir, "40_testing"),
-        "50_maintenance": os.path.join(work_efforts_dir, "50_maintenance"),
+        "00_system": f"{prefix}00_system",
+        "10_development": f"{prefix}10_development",
+        "20_debugging": f"{prefix}20_debugging",
+        "30_documentation": f"{prefix}30_documentation",
+        "40_testing": f"{prefix}40_testing",
+        "50_maintenance": f"{prefix}50_maintenance",
     }
 
     # Essential directories only (no more active/completed status folders)
-    templates_dir = os.path.join(work_efforts_dir, "templates")
-    archived_dir = os.path.join(work_efforts_dir, "archived")
-    scripts_dir = os.path.join(work_efforts_dir, "scripts")
+    templates_dir = f"{prefix}templates"
+    archived_dir = f"{prefix}archived"
+    scripts_dir = f"{prefix}scripts"
 
     if create_dirs:
-        # Create work_efforts root directory
-        if not os.path.exists(work_efforts_dir):
+        # Collect "Created ..." messages to print in one call
+        created = []
+
+        # Create work_efforts root directory, or list what it already holds.
+        # The entry names answer every "does it exist" question below with a
+        # set lookup instead of a stat or mkdir attempt per path
+        try:
             os.makedirs(work_efforts_dir)
-            print(f"Created directory: {work_efforts_dir}")
+            created.append(f"Created directory: {work_efforts_dir}")
+            existing = set()
+        except FileExistsError:
+            with os.scandir(work_efforts_dir) as entries:
+                existing = {entry.name for entry in entries}
 
         # Create Johnny Decimal directories
         for category_name, category_dir in johnny_decimal_dirs.items():
-            if not os.path.exists(category_dir):
-                os.makedirs(category_dir)
-                print(f"Created Johnny Decimal directory: {category_dir}")
+            if category_name not in existing:
+                os.makedirs(category_dir, exist_ok=True)
+                created.append(f"Created Johnny Decimal directory: {category_dir}")
 
         # Create essential directories only (removed active/completed)
-        for directory in [templates_dir, archived_dir, scripts_dir]:
-            if not os.path.exists(directory):
-                os.makedirs(directory)
-                print(f"Created directory: {directory}")
+        for directory_name, directory in [("templates", templates_dir), ("archived", archived_dir), ("scripts", scripts_dir)]:
+            if directory_name not in existing:
+                os.makedirs(directory, exist_ok=True)
+                created.append(f"Created directory: {directory}")
+
+        if created:
+            print("\n".join(created))
+
+        # A scripts directory that was already there may hold files too
+        if "scripts" in existing:
+            with os.scandir(scripts_dir) as entries:
+                existing_scripts = {entry.name for entry in entries}
+        else:
+            existing_scripts = set()
 
         # Create Johnny Decimal index files
         create_johnny_decimal_index_files(work_efforts_dir, johnny_decimal_dirs)
 
         # Create main work efforts index
         main_index_path = os.path.join(work_efforts_dir, "00.00_work_efforts_index.md")
-        if not os.path.exists(main_index_path):
+        if "00.00_work_efforts_index.md" not in existing:
             create_main_work_efforts_index(main_index_path)
 
         # Create a README in the work_efforts directory
         readme_path = os.path.join(work_efforts_dir, "README.md")
-        if not os.path.exists(readme_path):
+        if "README.md" not in existing:
             with open(readme_path, "w") as f:
-                f.write("""# Work Efforts - Johnny Decimal System
-
-This directory contains structured documentation for tracking tasks, features, and bug fixes using the Johnny Decimal methodology.
-
-## Johnny Decimal Structure
-
-### Major Categories
-- **00_system** - System and infrastructure work
-- **10_development** - Feature development and code improvements
-- **20_debugging** - Debugging and troubleshooting
-- **30_documentation** - Documentation and guides
-- **40_testing** - Testing and validation
-- **50_maintenance** - Maintenance and updates
-
-### Navigation
-Start with the main index: `00.00_work_efforts_index.md`
-
-Each category has its own index file (e.g., `00_system/00.00_index.md`)
-
-## Status Management
-Work effort status is managed within each document's frontmatter:
-- **status: "active"** - Currently being worked on
-- **status: "paused"** - Temporarily on hold
-- **status: "completed"** - Finished successfully
-- **status: "cancelled"** - Abandoned or no longer needed
-
-## Essential Directories
-- **templates/** - Templates for work effort documents
-- **archived/** - Deprecated or abandoned work efforts (for permanent archive)
-- **scripts/** - Helper scripts for managing work efforts
-
-## Usage
-
-Create a new work effort:
-```
-cc-ai work_effort --title "Feature Name" --priority high
-```
-
-Or use the interactive mode:
-```
-cc-ai work_effort -i
-```
-
-List all work efforts:
-```
-cc-ai list
-```
-""")
+                f.write(WORK_EFFORTS_README)
             print(f"Created README at: {readme_path}")
 
         # Create an __init__.py file in the scripts directory
         init_py_path = os.path.join(scripts_dir, "__init__.py")
-        if not os.path.exists(init_py_path):
+        if "__init__.py" not in existing_scripts:
             with open(init_py_path, "w") as f:
                 f.write("# work_efforts scripts package")
             print(f"Created __init__.py at: {init_py_path}")
+            existing_scripts.add("__init__.py")
 
         # Create an __init__.py file in the work_efforts directory
         work_efforts_init_py_path = os.path.join(work_efforts_dir, "__init__.py")
-        if not os.path.exists(work_efforts_init_py_path):
+        if "__init__.py" not in existing:
             with open(work_efforts_init_py_path, "w") as f:
                 f.write("# work_efforts package")
             print(f"Created __init__.py at: {work_efforts_init_py_path}")
 
         # Copy script files from the package
         try:
-            # Try to find the scripts in the installed package
-            package_dir = os.path.dirname(os.path.abspath(__file__))
-            package_scripts_dir = os.path.join(package_dir, "work_efforts", "scripts")
-
-            # If not found, try looking in the development directory structure
-            if not os.path.exists(package_scripts_dir):
-                package_scripts_dir = os.path.join(os.path.dirname(package_dir), "work_efforts", "scripts")
+            import shutil
 
-            if os.path.exists(package_scripts_dir):
+            package_scripts_dir = find_package_scripts_dir()
+            if package_scripts_dir is not None:
+                # Join the directory prefixes once instead of per file
+                source_prefix = f"{package_scripts_dir}{os.sep}"
+                target_prefix = f"{scripts_dir}{os.sep}"
                 for script_file in os.listdir(package_scripts_dir):
                     if script_file.endswith(".py"):
-                        source = os.path.join(package_scripts_dir, script_file)
-                        target = os.path.join(scripts_dir, script_file)
-                        if os.path.isfile(source) and not os.path.exists(target):
+                        source = f"{source_prefix}{script_file}"
+                        target = f"{target_prefix}{script_file}"
+                        if script_file not in existing_scripts and os.path.isfile(source):
                             shutil.copy2(source, target)
                             print(f"Copied script: {script_file} to {scripts_dir}")
         except Exception as e:
@@ -760,26 +863,14 @@ The Johnny Decimal system organizes information using a hierarchical numbering s
 - **00.00**: Always the index file for each category
 
 Status is managed in each document's frontmatter rather than separate folder structures.
-""".format(date=datetime.now().strftime("%Y-%m-%d"))
+""".format(date=date.today().isoformat())
 
     with open(index_path, "w") as f:
         f.write(content)
     print(f"Created main work efforts index: {index_path}")
 
-def create_template_if_missing(template_path):
-    """Copy the main template to the work efforts template directory if it doesn't exist"""
-    if not os.path.exists(template_path):
-        # First check if we have a template in the project root
-        source_template = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-                                    "templates", "work-effort-template.md")
-
-        if os.path.exists(source_template):
-            # Copy the template from the project
-            shutil.copy2(source_template, template_path)
-            print(f"Copied template file to: {template_path}")
-        else:
-            # Create a default template if source not found
-            template_content = """---
+# Template written when the project does not ship one
+DEFAULT_WORK_EFFORT_TEMPLATE = """---
 title: "{{title}}"
 status: "{{status}}" # options: active, paused, completed
 priority: "{{priority}}" # options: low, medium, high, critical
@@ -818,28 +909,59 @@ tags: [feature, bugfix, refactor, documentation, testing, devops]
 - **Updated**: {{last_updated}}
 - **Target Completion**: {{due_date}}
 """
-            with open(template_path, "w") as f:
-                f.write(template_content)
+
+def create_template_if_missing(template_path):
+    """Copy the main template to the work efforts template directory if it doesn't exist"""
+    if not os.path.exists(template_path):
+        # First check if we have a template in the project root
+        source_template = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                    "templates", "work-effort-template.md")
+
+        if os.path.exists(source_template):
+            # Copy the template from the project
+            import shutil
+            shutil.copy2(source_template, template_path)
+            print(f"Copied template file to: {template_path}")
+        else:
+            # Create a default template if source not found
+            with open(template_path, "w", encoding="utf-8") as f:
+                f.write(DEFAULT_WORK_EFFORT_TEMPLATE)
             print(f"Created template file at: {template_path}")
 
+# Priority levels accepted by validate_priority
+VALID_PRIORITIES = frozenset({"low", "medium", "high", "critical"})
+
 def validate_priority(priority):
     """Validate that priority is one of the allowed values"""
-    valid_priorities = ["low", "medium", "high", "critical"]
-    if priority.lower() not in valid_priorities:
+    normalized = priority.lower()
+    if normalized not in VALID_PRIORITIES:
         print(f"Warning: '{priority}' is not a recognized priority level. Using 'medium' instead.")
         return "medium"
-    return priority.lower()
+    return normalized
 
 def validate_date(date_str):
     """Validate the date format"""
     try:
-        datetime.strptime(date_str, "%Y-%m-%d")
+        # Check YYYY-MM-DD by hand; strptime imports and runs the _strptime
+        # regex machinery for what is three integers. date() still rejects
+        # out-of-range months and days
+        year, month, day = date_str.split("-")
+        if len(year) != 4 or len(month) > 2 or len(day) > 2 or not (year + month + day).isdigit():
+            raise ValueError(date_str)
+        date(int(year), int(month), int(day))
         return date_str
     except ValueError:
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = date.today().isoformat()
         print(f"Warning: Invalid date format. Using today's date ({today}) instead.")
         return today
 
+# Matches {{name}} placeholders in work effort templates
+TEMPLATE_PLACEHOLDER_PATTERN = re.compile(r"\{\{(\w+)\}\}")
+
+# Characters replaced with '_' in work effort filenames: anything that is not
+# alphanumeric or a space (\w is str.isalnum() plus '_', which maps to itself)
+UNSAFE_TITLE_CHARS_PATTERN = re.compile(r"[^\w ]")
+
 def create_work_effort(title, assignee, priority, due_date, template_path, work_efforts_dir, content=None, category=None):
     """
     Create a new work effort file in the appropriate Johnny Decimal category
@@ -857,32 +979,45 @@ def create_work_effort(title, assignee, priority, due_date, template_path, work_
 
         # Ensure category exists
         category_dir = os.path.join(work_efforts_dir, category)
-        if not os.path.exists(category_dir):
-            os.makedirs(category_dir, exist_ok=True)
+        try:
+            os.makedirs(category_dir)
             print(f"Created category directory: {category_dir}")
-
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-        filename_timestamp = datetime.now().strftime("%Y%m%d%H%M")
+        except FileExistsError:
+            pass
+
+        # Read the clock once so the filename and frontmatter agree
+        now = datetime.now()
+        # Format the fields directly; strftime goes through the C locale
+        # formatter for what are plain zero-padded numbers
+        date_part = f"{now.year:04d}-{now.month:02d}-{now.day:02d}"
+        time_part = f"{now.hour:02d}:{now.minute:02d}"
+        timestamp = f"{date_part} {time_part}"
+        filename_timestamp = f"{now.year:04d}{now.month:02d}{now.day:02d}{now.hour:02d}{now.minute:02d}"
 
         # Generate a safe filename
-        safe_title = ''.join(c if c.isalnum() or c == ' ' else '_' for c in title)
+        safe_title = UNSAFE_TITLE_CHARS_PATTERN.sub('_', title)
         filename = f"{filename_timestamp}_{safe_title.lower().replace(' ', '_')}.md"
 
         # Target file path in the category directory
         file_path = os.path.join(category_dir, filename)
 
         # Read template file
-        with open(template_path, "r") as template_file:
+        with open(template_path, "r", encoding="utf-8") as template_file:
             template_content = template_file.read()
 
         # Replace template variables
-        filled_content = template_content.replace("{{title}}", title)
-        filled_content = filled_content.replace("{{status}}", "active")
-        filled_content = filled_content.replace("{{priority}}", priority)
-        filled_content = filled_content.replace("{{assignee}}", assignee)
-        filled_content = filled_content.replace("{{created}}", timestamp)
-        filled_content = filled_content.replace("{{last_updated}}", timestamp)
-        filled_content = filled_content.replace("{{due_date}}", due_date)
+        values = {
+            "title": title,
+            "status": "active",
+            "priority": priority,
+            "assignee": assignee,
+            "created": timestamp,
+            "last_updated": timestamp,
+            "due_date": due_date,
+        }
+        # One pass over the template; unknown placeholders are left as they are
+        filled_content = TEMPLATE_PLACEHOLDER_PATTERN.sub(
+            lambda match: values.get(match.group(1), match.group(0)), template_content)
 
         # If AI-generated content is provided, replace the placeholders
         if content and isinstance(content, dict):
@@ -894,7 +1029,7 @@ def create_work_effort(title, assignee, priority, due_date, template_path, work_
                 filled_content = filled_content.replace("- Context, links to relevant code, designs, references.", content["notes"])
 
         # Write new file
-        with open(file_path, "w") as new_file:
+        with open(file_path, "w", encoding="utf-8") as new_file:
             new_file.write(filled_content)
 
         print(f"🚀 New work effort created at: {file_path}")
@@ -917,6 +1052,7 @@ async def setup_selected_directories():
         return 1
 
     # Set up work efforts in each selected directory
+    today = date.today().isoformat()
     for directory in selected_dirs:
         dir_name = os.path.basename(directory)
         print(f"\n🔄 Setting up {dir_name}...")
@@ -930,7 +1066,7 @@ async def setup_selected_directories():
             title="Getting Started",
             assignee="self",
             priority="medium",
-            due_date=datetime.now().strftime("%Y-%m-%d"),
+            due_date=today,
             template_path=template_path,
             work_efforts_dir=work_efforts_dir,
             category="00_system"
@@ -949,11 +1085,11 @@ async def setup_ai_in_current_dir():
 
     # Check if .AI_setup already exists
     ai_setup_dir = os.path.join(current_dir, ".AI_setup")
-    ai_setup_exists = os.path.exists(ai_setup_dir) and os.path.isdir(ai_setup_dir)
+    ai_setup_exists = os.path.isdir(ai_setup_dir)
 
     # Check if work_efforts already exists in the root
     work_efforts_dir = os.path.join(current_dir, "work_efforts")
-    work_efforts_exists = os.path.exists(work_efforts_dir) and os.path.isdir(work_efforts_dir)
+    work_efforts_exists = os.path.isdir(work_efforts_dir)
 
     # If both exist, inform the user and exit
     if ai_setup_exists and work_efforts_exists:
@@ -988,7 +1124,7 @@ async def setup_ai_in_current_dir():
             title="Getting Started",
             assignee="self",
             priority="medium",
-            due_date=datetime.now().strftime("%Y-%m-%d"),
+            due_date=date.today().isoformat(),
             template_path=root_template_path,
             work_efforts_dir=root_work_efforts_dir,
             category="00_system"
@@ -1025,23 +1161,19 @@ async def interactive_mode(template_path, work_efforts_dir):
     print("Press Enter to accept the default values shown in brackets.\n")
 
     # Get user input with defaults
-    title_input = input("Title (name of your work effort) [Untitled]: ")
-    title = title_input if title_input.strip() else "Untitled"
+    title = prompt_optional("Title (name of your work effort) [Untitled]: ") or "Untitled"
 
-    assignee_input = input("Assignee (who is responsible) [self]: ")
-    assignee = assignee_input if assignee_input.strip() else "self"
+    assignee = prompt_optional("Assignee (who is responsible) [self]: ") or "self"
 
     print("\nPriority levels:")
     print("  low      - Can be done when time permits")
     print("  medium   - Important but not urgent")
     print("  high     - Urgent and should be done soon")
     print("  critical - Requires immediate attention")
-    priority_input = input("Priority [medium]: ")
-    priority = priority_input if priority_input.strip() else "medium"
+    priority = prompt_optional("Priority [medium]: ") or "medium"
 
-    today = datetime.now().strftime("%Y-%m-%d")
-    due_date_input = input(f"Due date (YYYY-MM-DD) [{today}]: ")
-    due_date = due_date_input if due_date_input.strip() else today
+    today = date.today().isoformat()
+    due_date = prompt_optional(f"Due date (YYYY-MM-DD) [{today}]: ") or today
 
     # Ask for category
     print("\nWork effort categories:")
@@ -1051,13 +1183,12 @@ async def interactive_mode(template_path, work_efforts_dir):
     print("  30_documentation - Documentation and guides")
     print("  40_testing      - Testing and validation")
     print("  50_maintenance  - Maintenance and updates")
-    category_input = input("Category [10_development]: ")
-    category = category_input if category_input.strip() else "10_development"
+    category = prompt_optional("Category [10_development]: ") or "10_development"
 
     # Explicitly ask if user wants to use AI content generation
     print("\nAI Content Generation:")
     print("This feature can automatically generate objectives, tasks, and notes based on a description.")
-    use_ai_input = input("Use AI to generate content? (y/N): [default: NO] ")
+    use_ai_input = prompt_user("Use AI to generate content? (y/N): [default: NO] ")
     use_ai = use_ai_input.lower() in ('y', 'yes')
 
     content = None
@@ -1065,7 +1196,7 @@ async def interactive_mode(template_path, work_efforts_dir):
         # Ask for description for AI content generation
         print("\nProvide a description of what this work effort is about.")
         print("Example: \"Implement user authentication with email verification and password reset\"")
-        description_input = input("\nDescription: ")
+        description_input = prompt_user("\nDescription: ")
 
         if description_input.strip():
             available_models = get_available_ollama_models()
@@ -1073,12 +1204,12 @@ async def interactive_mode(template_path, work_efforts_dir):
             if available_models:
                 default_model = "phi3" if "phi3" in available_models else available_models[0]
                 print(f"\nAvailable AI models: {', '.join(available_models)}")
-                model_input = input(f"Choose a model [{default_model}]: ")
+                model_input = prompt_user(f"Choose a model [{default_model}]: ")
                 model = model_input if model_input.strip() and model_input in available_models else default_model
 
                 # Show timeout options
                 print("\nTimeout is how long to wait for AI to generate content before aborting.")
-                timeout_input = input(f"Timeout in seconds [30]: ")
+                timeout_input = prompt_user(f"Timeout in seconds [30]: ")
                 timeout = int(timeout_input) if timeout_input.strip().isdigit() else 30
 
                 print("\nGenerating content... (Press Ctrl+C to abort)")
@@ -1124,16 +1255,20 @@ def list_work_efforts(work_efforts_dir):
 
     for category in categories:
         category_dir = os.path.join(work_efforts_dir, category)
-        if os.path.exists(category_dir):
+        if os.path.isdir(category_dir):
             # Get all .md files except index files
-            files = [f for f in os.listdir(category_dir)
-                    if f.endswith(".md") and not f.startswith("00.00")]
+            with os.scandir(category_dir) as entries:
+                files = [e.name for e in entries
+                        if e.name.endswith(".md") and not e.name.startswith("00.00")
+                        and e.is_file()]
 
+            # Join the directory prefix once instead of per file
+            category_prefix = f"{category_dir}{os.sep}"
             for file in files:
-                file_path = os.path.join(category_dir, file)
+                file_path = f"{category_prefix}{file}"
                 try:
                     # Read the frontmatter to get status
-                    with open(file_path, 'r') as f:
+                    with open(file_path, 'r', encoding='utf-8') as f:
                         content = f.read()
 
                     # Extract status from frontmatter
@@ -1150,19 +1285,12 @@ def list_work_efforts(work_efforts_dir):
                                     status = status_value.lower()
                                     break
 
-                    # Add to appropriate status list
+                    # Add to appropriate status list as a (file, category) pair;
+                    # nothing else about the effort is needed for the listing
                     if status in work_efforts_by_status:
-                        work_efforts_by_status[status].append({
-                            'file': file,
-                            'category': category,
-                            'path': file_path
-                        })
+                        work_efforts_by_status[status].append((file, category))
                     else:
-                        work_efforts_by_status["active"].append({
-                            'file': file,
-                            'category': category,
-                            'path': file_path
-                        })
+                        work_efforts_by_status["active"].append((file, category))
 
                     total_files += 1
 
@@ -1174,23 +1302,28 @@ def list_work_efforts(work_efforts_dir):
         print("  No work efforts found. Create one with 'cc-ai we -i'")
         return
 
+    # Build the listing in one buffer and emit it with a single write
+    lines = []
     for status, efforts in work_efforts_by_status.items():
         if efforts:
             status_display = status.title()
-            print(f"\n{status_display} Work Efforts ({len(efforts)}):")
-            for effort in sorted(efforts, key=lambda x: x['file']):
-                category_display = effort['category'].replace('_', ' ').title()
-                print(f"  - {effort['file']} [{category_display}]")
+            lines.append(f"\n{status_display} Work Efforts ({len(efforts)}):")
+            for file, category in sorted(efforts):
+                category_display = category.replace('_', ' ').title()
+                lines.append(f"  - {file} [{category_display}]")
 
-    print(f"\n📊 Total: {total_files} work efforts across {len(categories)} categories")
+    lines.append(f"\n📊 Total: {total_files} work efforts across {len(categories)} categories")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def parse_arguments():
+    import argparse
+
     parser = argparse.ArgumentParser(description="AI Setup and Work Effort Tracker")
     parser.add_argument("--title", default="Untitled", help="Title of the work effort (default: Untitled)")
     parser.add_argument("--assignee", default="self", help="Assignee of the work effort (default: self)")
     parser.add_argument("--priority", default="medium", choices=["low", "medium", "high", "critical"],
                         help="Priority of the work effort (default: medium)")
-    parser.add_argument("--due-date", default=datetime.now().strftime("%Y-%m-%d"),
+    parser.add_argument("--due-date", default=date.today().isoformat(),
                         help="Due date in YYYY-MM-DD format (default: today)")
     parser.add_argument("-i", "--interactive", action="store_true",
                         help="Run in interactive mode (prompt for values)")
@@ -1204,12 +1337,64 @@ def parse_arguments():
     parser.add_argument("command", nargs="?", help="Command to run (setup, work, list, select)")
     return parser.parse_args()
 
-async def main():
-    args = parse_arguments()
+def print_version():
+    """Print the version number."""
+    print(f"Code Conductor version {VERSION}")
+
+# Short usage summary, built once and written in a single call
+INSTRUCTIONS_TEXT = """
+Usage Instructions:
+  cc-ai work_effort -i        - Create a new work effort interactively
+  cc-ai list                  - List existing work efforts
+  cc-ai setup                 - Set up AI assistance in the current directory
+
+Shorthand Commands:
+  cc-ai wei                    - Work effort interactive (same as work_effort -i)
+  cc-ai we                     - Work effort non-interactive (same as work_effort)
+  cc-ai l                       - List work efforts (same as list)
+  cc-ai s                       - Setup (same as setup)
+
+For more details, run: cc-ai help
+"""
+
+def show_instructions():
+    """Show usage instructions."""
+    sys.stdout.write(INSTRUCTIONS_TEXT)
+
+# Full command reference, built once and written in a single call
+HELP_TEXT = f"""
+Code Conductor - AI Development Environment Setup Tool
+Version: {VERSION}
+
+Commands:
+  cc-ai setup              - Set up AI assistance in the current directory
+  cc-ai work_effort        - Create a new work effort
+  cc-ai work_effort -i     - Create a new work effort interactively
+  cc-ai list               - List existing work efforts
+  cc-ai update-status      - Update the status of a work effort
+  cc-ai help               - Show this help text
+  cc-ai version            - Show the version number
+
+Shorthand Commands:
+  cc-ai wei                - Work effort interactive (same as work_effort -i)
+  cc-ai we                 - Work effort non-interactive (same as work_effort)
+  cc-ai l                  - List work efforts (same as list)
+  cc-ai s                  - Setup (same as setup)
+
+For more information, visit: https://github.com/ctavolazzi/code-conductor
+"""
+
+def show_help():
+    """Show the full command reference."""
+    sys.stdout.write(HELP_TEXT)
+
+async def main(args=None):
+    if args is None:
+        args = parse_arguments()
 
     # Handle version flag
     if args.version:
-        print(f"Code Conductor version {VERSION}")
+        print_version()
         return 0
 
     # If run with no args, automatically check for existing components and set up as needed
@@ -1222,60 +1407,45 @@ async def main():
 
     # Check for commands
     if args.command:
-        # Handle shorthand commands
+        # Canonicalize the command once: lowercase it, then resolve
+        # shorthand and alternate spellings with one lookup
         command = args.command.lower()
+        command = COMMAND_ALIASES.get(command, command)
 
-        # Map shorthand commands to full commands
-        shorthand_map = {
-            'wei': 'work_effort_interactive',  # Interactive work effort
-            'we': 'work_effort',               # Non-interactive work effort
-            'l': 'list',                      # List work efforts
-            's': 'setup'                      # Setup command
-        }
+        # For 'wei' shorthand, force interactive mode
+        if command == 'wei':
+            args.interactive = True
+            command = 'work_effort'
+
+        if command == 'help':
+            show_help()
+            return 0
 
-        # Convert shorthand to full command
-        if command in shorthand_map:
-            command = shorthand_map[command]
-            # For 'wei' shorthand, force interactive mode
-            if command == 'work_effort_interactive':
-                args.interactive = True
-                command = 'work_effort'
-
-        if command in ['-h', '--help', 'help']:
-            print("\nCode Conductor - AI Development Environment Setup Tool")
-            print(f"Version: {VERSION}")
-            print("\nCommands:")
-            print("  cc-ai setup              - Set up AI assistance in the current directory")
-            print("  cc-ai work_effort        - Create a new work effort")
-            print("  cc-ai work_effort -i     - Create a new work effort interactively")
-            print("  cc-ai list               - List existing work efforts")
-            print("  cc-ai update-status      - Update the status of a work effort")
-            print("  cc-ai help               - Show this help text")
-            print("  cc-ai version            - Show the version number")
-            print("\nShorthand Commands:")
-            print("  cc-ai wei                - Work effort interactive (same as work_effort -i)")
-            print("  cc-ai we                 - Work effort non-interactive (same as work_effort)")
-            print("  cc-ai l                  - List work efforts (same as list)")
-            print("  cc-ai s                  - Setup (same as setup)")
-            print("\nFor more information, visit: https://github.com/ctavolazzi/code-conductor")
+        if command == 'version':
+            print_version()
             return 0
 
         # Current directory check
         current_dir = os.getcwd()
         work_efforts_dir = os.path.join(current_dir, "work_efforts")
 
-        if command in ['work_effort', 'work', 'create']:
+        if command == 'work_effort':
+            just_set_up = False
             if not os.path.exists(work_efforts_dir):
                 print(f"\n📋 Work Effort Management")
                 print("======================")
                 print(f"⚠️ Work efforts directory not found in {current_dir}")
-                setup_first = input("Would you like to set up work efforts first? (y/n): ")
+                setup_first = prompt_user("Would you like to set up work efforts first? (y/n): ")
                 if setup_first.lower() == 'y':
                     await setup_ai_in_current_dir()
+                    just_set_up = True
                 else:
                     return 1
 
-            work_efforts_dir, template_path, archived_dir, scripts_dir = setup_work_efforts_structure(current_dir)
+            # Setup has just built the whole structure, so only the paths are
+            # needed; otherwise make sure nothing is missing
+            work_efforts_dir, template_path, archived_dir, scripts_dir = setup_work_efforts_structure(
+                current_dir, create_dirs=not just_set_up)
             create_template_if_missing(template_path)
 
             # Interactive or command-line work creation
@@ -1329,45 +1499,42 @@ async def main():
             print("Run 'cc-ai help' for usage information")
             return 1
 
-    # Interactive mode without a specific command
-    if args.interactive:
-        current_dir = os.getcwd()
-        work_efforts_dir = os.path.join(current_dir, "work_efforts")
+    # Only interactive mode without a specific command gets here: no-arg
+    # runs and every command branch have already returned
+    current_dir = os.getcwd()
+    work_efforts_dir = os.path.join(current_dir, "work_efforts")
 
-        if not os.path.exists(work_efforts_dir):
-            print(f"⚠️ Work efforts directory not found in {current_dir}")
-            setup_first = input("Would you like to set up work efforts first? (y/n): ")
-            if setup_first.lower() == 'y':
-                await setup_ai_in_current_dir()
-                return 0
-            else:
-                return 1
+    if not os.path.exists(work_efforts_dir):
+        print(f"⚠️ Work efforts directory not found in {current_dir}")
+        setup_first = prompt_user("Would you like to set up work efforts first? (y/n): ")
+        if setup_first.lower() == 'y':
+            await setup_ai_in_current_dir()
+            return 0
+        else:
+            return 1
 
-        work_efforts_dir, template_path, archived_dir, scripts_dir = setup_work_efforts_structure(current_dir)
-        create_template_if_missing(template_path)
-        await interactive_mode(template_path, work_efforts_dir)
-        return 0
+    work_efforts_dir, template_path, archived_dir, scripts_dir = setup_work_efforts_structure(current_dir)
+    create_template_if_missing(template_path)
+    await interactive_mode(template_path, work_efforts_dir)
+    return 0
 
 def main_entry():
     """Entry point for console_scripts"""
-    return asyncio.run(main())
+    # Version and help need no event loop, so answer them before asyncio.run
+    argv = sys.argv[1:]
+    if argv and argv[0] in ("-v", "--version", "version"):
+        print_version()
+        return 0
+    if argv and argv[0].lower() == "help":
+        show_help()
+        return 0
 
-if __name__ == "__main__":
-    asyncio.run(main())
+    # Parse before starting the event loop: argparse exits on -h/--help and on
+    # bad arguments, and neither needs asyncio imported
+    args = parse_arguments()
 
-def print_version():
-    """Print the version number."""
-    print(f"Code Conductor version {VERSION}")
+    import asyncio
+    return asyncio.run(main(args))
 
-def show_instructions():
-    """Show usage instructions."""
-    print("\nUsage Instructions:")
-    print("  cc-ai work_effort -i        - Create a new work effort interactively")
-    print("  cc-ai list                  - List existing work efforts")
-    print("  cc-ai setup                 - Set up AI assistance in the current directory")
-    print("\nShorthand Commands:")
-    print("  cc-ai wei                    - Work effort interactive (same as work_effort -i)")
-    print("  cc-ai we                     - Work effort non-interactive (same as work_effort)")
-    print("  cc-ai l                       - List work efforts (same as list)")
-    print("  cc-ai s                       - Setup (same as setup)")
-    print("\nFor more details, run: cc-ai help")
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(main_entry())
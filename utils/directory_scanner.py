@@ -1,6 +1,5 @@
 import os
 import sys
-import shutil
 from typing import List, Set, Tuple
 
 # Check if running on Windows or Unix-like system
@@ -25,22 +24,8 @@ YELLOW = '\033[93m' if os.name != 'nt' else ''
 BOLD = '\033[1m' if os.name != 'nt' else ''
 RESET = '\033[0m' if os.name != 'nt' else ''
 
-def create_ai_setup(root_dir=None):
-    """Create the .AI_setup folder structure with all necessary files."""
-    if root_dir is None:
-        root_dir = os.getcwd()
-
-    # Define the AI setup folder
-    setup_folder = os.path.join(root_dir, ".AI_setup")
-
-    # Create .AI_setup folder
-    if not os.path.exists(setup_folder):
-        os.makedirs(setup_folder)
-
-    # 1. Create INSTRUCTIONS.md
-    instructions_file = os.path.join(setup_folder, "INSTRUCTIONS.md")
-    with open(instructions_file, "w") as f:
-        f.write("""# AI_Setup Instructions
+# Static content of the generated .AI_setup files
+INSTRUCTIONS_MD = """# AI_Setup Instructions
 
 This directory contains setup files for AI_assisted development.
 
@@ -65,12 +50,9 @@ The AI_Setup package provides two main commands:
    - `ai_work_effort --help` - Show help information
 
 No action is required from you - the AI tools will automatically utilize these files.
-""")
+"""
 
-    # 2. Create AI_setup_validation_instructions.md
-    validation_file = os.path.join(setup_folder, "AI_setup_validation_instructions.md")
-    with open(validation_file, "w") as f:
-        f.write("""# AI Setup Validation Instructions
+VALIDATION_INSTRUCTIONS_MD = """# AI Setup Validation Instructions
 
 This file contains instructions for validating the AI setup in this project.
 It helps AI assistants understand how to verify that everything is working correctly.
@@ -104,12 +86,9 @@ ai_setup list
 ```
 
 This should show any existing work efforts or indicate that none exist yet.
-""")
+"""
 
-    # 3. Create AI_work_effort_system.md
-    work_effort_file = os.path.join(setup_folder, "AI_work_effort_system.md")
-    with open(work_effort_file, "w") as f:
-        f.write("""# AI Work Effort System
+WORK_EFFORT_SYSTEM_MD = """# AI Work Effort System
 
 This file describes the work effort system used in this project.
 It helps AI assistants understand how to manage and track work efforts.
@@ -181,12 +160,9 @@ Work efforts are organized into directories:
 - `work_efforts/active/` - Current, in-progress work
 - `work_efforts/completed/` - Successfully finished work
 - `work_efforts/archived/` - Deprecated or abandoned work
-""")
+"""
 
-    # 4. Create AI_setup_instructions.md
-    setup_instructions_file = os.path.join(setup_folder, "AI_setup_instructions.md")
-    with open(setup_instructions_file, "w") as f:
-        f.write("""# AI Setup Instructions
+SETUP_INSTRUCTIONS_MD = """# AI Setup Instructions
 
 This file contains detailed instructions for setting up AI assistance in this project.
 It helps AI assistants understand how to configure and use the AI tools.
@@ -274,43 +250,97 @@ The `ai_work_effort` command supports integration with Ollama for AI-powered con
 2. Generate structured content based on your description
 3. Provide an interactive console experience with animated typing
 4. Allow for timeout configuration and graceful interruption
-""")
+"""
+
+def create_ai_setup(root_dir=None):
+    """Create the .AI_setup folder structure with all necessary files."""
+    if root_dir is None:
+        root_dir = os.getcwd()
+
+    # Define the AI setup folder
+    setup_folder = os.path.join(root_dir, ".AI_setup")
+
+    # Create .AI_setup folder
+    os.makedirs(setup_folder, exist_ok=True)
+
+    # 1. Create INSTRUCTIONS.md
+    instructions_file = os.path.join(setup_folder, "INSTRUCTIONS.md")
+    with open(instructions_file, "w") as f:
+        f.write(INSTRUCTIONS_MD)
+
+    # 2. Create AI_setup_validation_instructions.md
+    validation_file = os.path.join(setup_folder, "AI_setup_validation_instructions.md")
+    with open(validation_file, "w") as f:
+        f.write(VALIDATION_INSTRUCTIONS_MD)
+
+    # 3. Create AI_work_effort_system.md
+    work_effort_file = os.path.join(setup_folder, "AI_work_effort_system.md")
+    with open(work_effort_file, "w") as f:
+        f.write(WORK_EFFORT_SYSTEM_MD)
+
+    # 4. Create AI_setup_instructions.md
+    setup_instructions_file = os.path.join(setup_folder, "AI_setup_instructions.md")
+    with open(setup_instructions_file, "w") as f:
+        f.write(SETUP_INSTRUCTIONS_MD)
 
     print(f"✅ Created AI_setup in: {root_dir}")
     return setup_folder
 
-def install_ai_setup(target_dirs):
-    """Install AI_setup in target directories."""
-    # Create a temporary .AI_setup in the current directory
-    temp_dir = os.getcwd()
-    setup_folder = create_ai_setup(temp_dir)
+def install_ai_setup_in_dir(directory, setup_folder):
+    """Copy a generated .AI_setup folder into one directory.
+
+    Returns the status messages for the directory so the caller can print
+    them in order.
+    """
+    # Skip if directory doesn't exist
+    if not os.path.isdir(directory):
+        return [f"❌ Directory not found: {directory}"]
 
-    # Copy to selected directories
-    for directory in target_dirs:
-        # Skip if directory doesn't exist
-        if not os.path.exists(directory) or not os.path.isdir(directory):
-            print(f"❌ Directory not found: {directory}")
-            continue
+    # Skip if already installed
+    if is_ai_setup_installed(directory):
+        return [f"⚠️ AI_setup already installed in: {directory}"]
 
-        # Skip if already installed
-        if is_ai_setup_installed(directory):
-            print(f"⚠️ AI_setup already installed in: {directory}")
-            continue
+    import shutil
 
+    copying = f"Copying AI_setup files to {directory}..."
+    try:
         # Create .AI_setup in target directory
         target_setup = os.path.join(directory, ".AI_setup")
-        if not os.path.exists(target_setup):
-            os.makedirs(target_setup)
+        os.makedirs(target_setup, exist_ok=True)
 
         # Copy all files from temporary .AI_setup to target
-        print(f"Copying AI_setup files to {directory}...")
-        for item in os.listdir(setup_folder):
-            source = os.path.join(setup_folder, item)
-            target = os.path.join(target_setup, item)
-            if os.path.isfile(source):
-                shutil.copy2(source, target)
+        with os.scandir(setup_folder) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    # The sources were just generated, so there is no metadata
+                    # worth preserving; copyfile skips copy2's copystat calls
+                    shutil.copyfile(entry.path, os.path.join(target_setup, entry.name))
+    except OSError as e:
+        # Report the failure so the other targets' results are still printed
+        return [copying, f"❌ Failed to install AI_setup in {directory}: {e}"]
+
+    return [copying, f"✅ Installed AI_setup in: {directory}"]
+
+def install_ai_setup(target_dirs):
+    """Install AI_setup in target directories."""
+    import shutil
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Create a temporary .AI_setup in the current directory
+    temp_dir = os.getcwd()
+    setup_folder = create_ai_setup(temp_dir)
 
-        print(f"✅ Installed AI_setup in: {directory}")
+    # Copy to selected directories. The targets are independent and the work
+    # is file I/O, so a few threads overlap the copies; messages are printed
+    # afterwards in the original order
+    if target_dirs:
+        with ThreadPoolExecutor(max_workers=min(8, len(target_dirs))) as executor:
+            results = list(executor.map(
+                lambda directory: install_ai_setup_in_dir(directory, setup_folder),
+                target_dirs))
+        for messages in results:
+            for message in messages:
+                print(message)
 
     # Clean up temporary .AI_setup if it was created for this operation
     if os.path.dirname(setup_folder) == temp_dir:
@@ -318,9 +348,8 @@ def install_ai_setup(target_dirs):
 
 def is_ai_setup_installed(directory: str) -> bool:
     """Check if AI_setup is already installed in a directory."""
-    if not os.path.exists(directory) or not os.path.isdir(directory):
-        return False
-
+    # A single stat answers both questions: the path cannot exist unless
+    # `directory` is an existing directory
     return os.path.exists(os.path.join(directory, ".AI_setup"))
 
 def get_directories(base_dir: str = ".") -> List[str]:
@@ -334,17 +363,15 @@ def get_directories(base_dir: str = ".") -> List[str]:
         List[str]: List of directory names
     """
     try:
-        # Get all items in the directory
-        items = os.listdir(base_dir)
-
         # Filter for directories, exclude hidden ones and special directories
-        directories = [
-            item for item in items
-            if os.path.isdir(os.path.join(base_dir, item))
-            and not item.startswith('.')
-            and not item.endswith('.egg-info')
-            and item not in ['__pycache__', 'node_modules', 'venv', '.venv', 'env', '.env']
-        ]
+        with os.scandir(base_dir) as entries:
+            directories = [
+                entry.name for entry in entries
+                if entry.is_dir()
+                and not entry.name.startswith('.')
+                and not entry.name.endswith('.egg-info')
+                and entry.name not in ['__pycache__', 'node_modules', 'venv', '.venv', 'env', '.env']
+            ]
 
         # Ensure no duplicates by converting to set and back to list
         unique_directories = sorted(set(directories))
@@ -397,9 +424,12 @@ def print_directory_menu(directories, selected, current_idx, visible_range=None,
 
     start_idx, end_idx = visible_range
 
+    # Look up the working directory once per redraw rather than per item
+    current_dir = os.getcwd()
+
     # Print header
     print(f"{BOLD}📂 Directory Selection{RESET}")
-    print(f"Found {len(directories)} directories in: {os.getcwd()}")
+    print(f"Found {len(directories)} directories in: {current_dir}")
     print(f"Use {CYAN}↑/↓{RESET} to navigate | {CYAN}SPACE{RESET} to select | {CYAN}ENTER{RESET} to confirm | {CYAN}'a'{RESET} to select all | {CYAN}ESC/q{RESET} to quit")
     print()
 
@@ -408,7 +438,7 @@ def print_directory_menu(directories, selected, current_idx, visible_range=None,
         directory = directories[idx]
         is_selected = directory in selected
         is_current = idx == current_idx
-        has_ai_setup = is_ai_setup_installed(os.path.join(os.getcwd(), directory))
+        has_ai_setup = is_ai_setup_installed(os.path.join(current_dir, directory))
 
         print(draw_menu_item(idx, directory, is_selected, is_current, has_ai_setup))
 
@@ -1,9 +1,11 @@
 import os
 import re
-import subprocess
-import platform
 from datetime import datetime
 
+# Patterns used by sanitize_directory_name, compiled once at import
+SPECIAL_CHARS_PATTERN = re.compile(r'[^\w\s-]')
+SEPARATOR_RUN_PATTERN = re.compile(r'[-\s]+')
+
 def sanitize_directory_name(name):
     """
     Convert a user input string into a valid directory name.
@@ -15,8 +17,8 @@ def sanitize_directory_name(name):
         Sanitized string valid for directory name
     """
     # Replace spaces with hyphens and remove special characters
-    sanitized = re.sub(r'[^\w\s-]', '', name).strip()
-    sanitized = re.sub(r'[-\s]+', '-', sanitized)
+    sanitized = SPECIAL_CHARS_PATTERN.sub('', name).strip()
+    sanitized = SEPARATOR_RUN_PATTERN.sub('-', sanitized)
 
     if not sanitized:
         sanitized = "new-project"  # Default if name is empty after sanitization
@@ -140,8 +142,11 @@ def init_git_repo(project_dir):
     Returns:
         bool: True if successful, False otherwise
     """
+    import subprocess
+
     try:
-        subprocess.run(["git", "init"], cwd=project_dir, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        # The output is never read, so discard it rather than buffering pipes
+        subprocess.run(["git", "init"], cwd=project_dir, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         print(f"✅ Initialized git repository")
         return True
     except (subprocess.SubprocessError, FileNotFoundError):
@@ -1,7 +1,6 @@
 import os
 import json
 import asyncio
-import requests
 import random
 import sys
 import time
@@ -154,6 +153,10 @@ async def generate_content_with_ollama(description: str, model: str = "phi3") ->
         Keep the content concise and focused.
         """
 
+        # requests is only needed once a model is actually called, so it is
+        # imported here rather than on every CLI start
+        import requests
+
         # Make the actual API call with streaming enabled
         response = requests.post(
             "http://localhost:11434/api/generate",
@@ -208,6 +211,8 @@ async def generate_content_with_ollama(description: str, model: str = "phi3") ->
 def get_available_ollama_models():
     """Get a list of available Ollama models."""
     try:
+        import requests
+
         response = requests.get("http://localhost:11434/api/tags")
         if response.status_code == 200:
             models = response.json().get("models", [])